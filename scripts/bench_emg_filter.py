@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Benchmark the Finger EMG filter chain against the pure-Python biquad loop it replaced.
+
+Runs both implementations on the same uniform noise and prints the section count, the
+largest absolute difference and the timings for each sample rate:
+
+    python scripts/bench_emg_filter.py
+    python scripts/bench_emg_filter.py --seconds 30 --rates 10000,44100,48000
+
+Needs numpy and scipy (see requirements.txt). app.py is imported from the repo root, so
+run it from a checkout; no server, credentials or upload directory are touched.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+import app  # noqa: E402
+
+
+def apply_biquad(signal, coeffs):
+    # The direct form I loop _filter_emg used before it moved to scipy.signal.sosfilt.
+    b0, b1, b2, a1, a2 = coeffs
+    out = []
+    x1 = x2 = 0.0
+    y1 = y2 = 0.0
+    for x0 in signal:
+        y0 = b0 * x0 + b1 * x1 + b2 * x2 - a1 * y1 - a2 * y2
+        out.append(y0)
+        x2, x1 = x1, x0
+        y2, y1 = y1, y0
+    return out
+
+
+def reference_filter(signal, fs):
+    filtered = apply_biquad(signal, app._biquad_coeffs_highpass(fs, app.FINGER_EMG_HIGHPASS_HZ))
+    filtered = apply_biquad(filtered, app._biquad_coeffs_lowpass(fs, app.FINGER_EMG_LOWPASS_HZ))
+    harmonic = app.FINGER_EMG_NOTCH_BASE_HZ
+    while harmonic < fs * 0.5:
+        filtered = apply_biquad(filtered, app._biquad_coeffs_notch(fs, harmonic))
+        harmonic *= 2.0
+    return filtered
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--seconds', type=float, default=60.0, help='signal length per rate (default 60)')
+    parser.add_argument('--rates', default='10000,44100', help='comma-separated sample rates in Hz')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f'{"fs":>8}  {"sections":>8}  {"max |old - new|":>15}  {"old":>8}  {"new":>8}  {"speedup":>7}')
+    for fs in (int(rate) for rate in args.rates.split(',') if rate.strip()):
+        signal = rng.uniform(-1.0, 1.0, int(fs * args.seconds))
+        as_list = signal.tolist()
+
+        started = time.perf_counter()
+        old = np.asarray(reference_filter(as_list, fs))
+        old_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        new = app._filter_emg(signal, fs)
+        new_s = time.perf_counter() - started
+
+        print(
+            f'{fs:>8}  {len(app._finger_emg_sos(fs)):>8}  {np.max(np.abs(old - new)):>15.1e}  '
+            f'{old_s:>7.2f}s  {new_s * 1000:>6.0f}ms  {old_s / new_s:>6.0f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,9 @@
   const state = {
     summary: null,
     charts: {},
+    renderPending: false,
+    traces: {},
+    live: false,
   };
 
   const els = {
@@ -163,14 +166,68 @@
     return sessions.find((row) => row.session_id === id) || sessions[0];
   }
 
+  // Traces come from the server as base64 little-endian float32 columns; NaN marks a gap.
+  function decodeFloat32(text) {
+    const binary = atob(text || '');
+    const view = new DataView(new ArrayBuffer(binary.length));
+    for (let i = 0; i < binary.length; i += 1) view.setUint8(i, binary.charCodeAt(i));
+    const out = new Array(binary.length / 4);
+    for (let i = 0; i < out.length; i += 1) {
+      const value = view.getFloat32(i * 4, true);
+      out[i] = Number.isNaN(value) ? null : value;
+    }
+    return out;
+  }
+
+  function decodeTrace(packed) {
+    const t = decodeFloat32(packed && packed.t);
+    const p = decodeFloat32(packed && packed.p);
+    return t.map((time, i) => ({ t: time, p: p[i] }));
+  }
+
+  // The list view only carries scalar rows; a session's traces are fetched when it is selected.
+  function loadSessionTraces(sessionId) {
+    if (!state.traces[sessionId]) {
+      state.traces[sessionId] = fetch(`/api/research/finger-emg/sessions/${encodeURIComponent(sessionId)}/traces`, { credentials: 'same-origin' })
+        .then((res) => {
+          if (!res.ok) throw new Error('Failed to load session traces');
+          return res.json();
+        })
+        .then((payload) => {
+          const traces = {};
+          Object.entries(payload.traces || {}).forEach(([key, packed]) => {
+            traces[key] = decodeTrace(packed);
+          });
+          return traces;
+        })
+        .catch((err) => {
+          delete state.traces[sessionId];
+          throw err;
+        });
+    }
+    return state.traces[sessionId];
+  }
+
   function renderSessionTrace(summary) {
     const session = selectedSession(summary);
-    if (!session) {
+    // Trace files are written with summary.json at the end of a job, so a row streamed
+    // from a running job has none yet; wait for the reload that follows the done event.
+    if (!session || state.live) {
       destroyChart('sessionTrace');
       return;
     }
-    const control = session.control_trace_ch1 || [];
-    const experiment = session.experiment_trace_ch1 || [];
+    loadSessionTraces(session.session_id).then((traces) => {
+      const current = selectedSession(state.summary);
+      if (current && current.session_id === session.session_id) drawSessionTrace(traces);
+    }).catch((err) => {
+      console.error(err);
+      destroyChart('sessionTrace');
+    });
+  }
+
+  function drawSessionTrace(traces) {
+    const control = traces.control_trace_ch1 || [];
+    const experiment = traces.experiment_trace_ch1 || [];
     upsertChart('sessionTrace', els.sessionTraceChart, {
       type: 'line',
       data: {
@@ -296,10 +353,123 @@
     }
   }
 
+  // Rows streamed from a running job replace the table as they arrive; the group charts
+  // follow once the job's final aggregate lands.
+  function scheduleLiveRender() {
+    if (state.renderPending) return;
+    state.renderPending = true;
+    requestAnimationFrame(() => {
+      state.renderPending = false;
+      const summary = state.summary || { sessions: [], group: {} };
+      try {
+        renderStats(summary);
+        renderSessionSelect(summary);
+        renderSessionTrace(summary);
+        renderSessionDeltas(summary);
+        renderSessionsTable(summary);
+      } catch (err) {
+        console.error(err);
+      }
+    });
+  }
+
+  function startLiveSummary() {
+    const previous = state.summary || {};
+    state.summary = { sessions: [], group: previous.group || {} };
+    state.live = true;
+  }
+
+  function addLiveSession(row) {
+    if (!row || row.error || !state.summary) return;
+    const sessions = state.summary.sessions.filter((item) => item.session_id !== row.session_id);
+    sessions.push(row);
+    sessions.sort((a, b) => (a.session_id < b.session_id ? -1 : a.session_id > b.session_id ? 1 : 0));
+    state.summary.sessions = sessions;
+    scheduleLiveRender();
+  }
+
+  function applyLiveGroup(payload) {
+    if (!state.summary || !payload) return;
+    state.summary.group = payload.group || {};
+    state.summary.errors = payload.errors || [];
+    renderGroupPower(state.summary);
+    renderPerievent(state.summary);
+  }
+
+  function describeProgress(progress) {
+    const p = progress || {};
+    if (p.stage === 'listing') return 'Listing Google Drive files...';
+    if (p.stage === 'downloading') {
+      return `Downloading from Drive: ${p.files_downloaded || 0} of ${p.files_to_download || 0} changed files (${p.files_listed || 0} listed)...`;
+    }
+    if (p.stage === 'analyzing') {
+      return `Analyzing sessions: ${p.sessions_analyzed || 0} of ${p.sessions_total || 0}...`;
+    }
+    return 'Working...';
+  }
+
+  function jobOutcome(job) {
+    if (!job || job.status !== 'succeeded') {
+      const account = job && job.service_account_email ? ` Share the folder with: ${job.service_account_email}` : '';
+      throw new Error(((job && job.error) || 'Background job failed') + account);
+    }
+    return job;
+  }
+
+  // Syncs and first-time analysis run as server-side jobs. Follow the job's event stream
+  // (EventSource resumes with Last-Event-ID after a dropped connection) and fall back to
+  // polling the job when streaming is unavailable.
+  function followJob(job) {
+    if (typeof EventSource === 'undefined' || !job || !job.id) return waitForJob(job);
+    setStatus(describeProgress(job.progress));
+    startLiveSummary();
+    const finished = new Promise((resolve, reject) => {
+      const source = new EventSource(`/api/research/jobs/${encodeURIComponent(job.id)}/events`);
+      const read = (event) => JSON.parse(event.data || 'null');
+      source.addEventListener('progress', (event) => setStatus(describeProgress(read(event))));
+      source.addEventListener('session', (event) => addLiveSession(read(event)));
+      source.addEventListener('summary', (event) => applyLiveGroup(read(event)));
+      source.addEventListener('done', (event) => {
+        source.close();
+        try {
+          resolve(jobOutcome(read(event)));
+        } catch (err) {
+          reject(err);
+        }
+      });
+      source.onerror = () => {
+        if (source.readyState !== EventSource.CLOSED) return;
+        waitForJob(job).then(resolve, reject);
+      };
+    });
+    return finished.finally(() => {
+      state.live = false;
+    });
+  }
+
+  async function waitForJob(job) {
+    let current = job;
+    while (current && (current.status === 'queued' || current.status === 'running')) {
+      setStatus(describeProgress(current.progress));
+      await new Promise(resolve => setTimeout(resolve, 1000));
+      const res = await fetch(`/api/research/jobs/${encodeURIComponent(current.id)}`, { credentials: 'same-origin' });
+      const payload = await res.json().catch(() => ({}));
+      if (!res.ok) throw new Error(payload.error || 'Lost track of the background job');
+      current = payload.job;
+    }
+    return jobOutcome(current);
+  }
+
   async function fetchData() {
     const res = await fetch('/api/research/finger-emg/data', { credentials: 'same-origin' });
     if (!res.ok) throw new Error('Failed to load finger-emg data');
-    state.summary = await res.json();
+    const payload = await res.json();
+    if (res.status === 202 && payload.job) {
+      await followJob(payload.job);
+      return fetchData();
+    }
+    state.summary = payload;
+    state.traces = {};
     renderAll();
   }
 
@@ -319,9 +489,12 @@
       if (!res.ok) {
         throw new Error(payload.error || 'Sync failed');
       }
-      state.summary = payload.summary || (payload && payload.summary) || state.summary;
-      renderAll();
-      setStatus('Drive sync complete and analysis refreshed.');
+      const job = await followJob(payload.job);
+      await fetchData();
+      const failed = (((job.result || {}).sync || {}).failed || []).length;
+      setStatus(failed
+        ? `Drive sync finished with ${failed} file(s) that could not be downloaded; analysis refreshed.`
+        : 'Drive sync complete and analysis refreshed.', Boolean(failed));
     } catch (err) {
       console.error(err);
       setStatus(String(err.message || err), true);
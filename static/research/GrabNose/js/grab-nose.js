@@ -467,10 +467,19 @@
   }
 
   async function loadData() {
-    const res = await fetch('/api/research/grab-nose/data', { credentials: 'same-origin' });
-    if (!res.ok) throw new Error('Failed to load grab-nose data');
-    const data = await res.json();
-    state.records = data.records || [];
+    let records = [];
+    let cursor = '';
+    let data = {};
+    do {
+      const params = new URLSearchParams({ limit: '2000' });
+      if (cursor) params.set('cursor', cursor);
+      const res = await fetch(`/api/research/grab-nose/data?${params}`, { credentials: 'same-origin' });
+      if (!res.ok) throw new Error('Failed to load grab-nose data');
+      data = await res.json();
+      records = data.reset ? (data.records || []) : records.concat(data.records || []);
+      cursor = data.cursor || '';
+    } while (data.has_more);
+    state.records = records;
     if (!state.records.length) {
       setStatus('No grab-nose records are available from the source sheet.', true);
     }
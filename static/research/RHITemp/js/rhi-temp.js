@@ -5,6 +5,7 @@
   const state = {
     records: [],
     summary: null,
+    cursor: 0,
     differenceChart: null,
     scatterChart: null
   };
@@ -715,12 +716,33 @@
     renderRecordsTable();
   }
 
-  async function loadData() {
-    const res = await fetch('/api/research/rhi-temp/data', { credentials: 'same-origin' });
-    if (!res.ok) throw new Error('Failed to load RHI temperature data');
-    const data = await res.json();
-    state.records = data.records || [];
+  // Write endpoints return only records appended after our cursor (delta: true) plus the
+  // recomputed summary; a reset means our cursor was stale and the records start over.
+  function applyRecords(data) {
+    const records = data.records || [];
+    state.records = data.delta && !data.reset ? state.records.concat(records) : records;
     state.summary = data.summary || {};
+    if (data.cursor !== undefined) state.cursor = data.cursor;
+  }
+
+  function withCursor(url) {
+    return state.cursor ? `${url}?since=${encodeURIComponent(state.cursor)}` : url;
+  }
+
+  async function loadData() {
+    let records = [];
+    let cursor = '';
+    let data = {};
+    do {
+      const params = new URLSearchParams({ limit: '2000' });
+      if (cursor) params.set('cursor', cursor);
+      const res = await fetch(`/api/research/rhi-temp/data?${params}`, { credentials: 'same-origin' });
+      if (!res.ok) throw new Error('Failed to load RHI temperature data');
+      data = await res.json();
+      records = data.reset ? (data.records || []) : records.concat(data.records || []);
+      cursor = data.cursor || '';
+    } while (data.has_more);
+    applyRecords({ ...data, delta: false, records });
     renderAll();
   }
 
@@ -751,7 +773,7 @@
     event.preventDefault();
     setStatus('Saving entry...');
     const payload = collectEntryPayload(event.currentTarget);
-    const res = await fetch('/api/research/rhi-temp/entry', {
+    const res = await fetch(withCursor('/api/research/rhi-temp/entry'), {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       credentials: 'same-origin',
@@ -762,8 +784,7 @@
       setStatus(data.error || 'Entry save failed', true);
       return;
     }
-    state.records = data.records || [];
-    state.summary = data.summary || {};
+    applyRecords(data);
     event.currentTarget.reset();
     renderAll();
     setStatus(`Saved ${data.added || 0} temperature readings.`);
@@ -778,13 +799,13 @@
     if (file) {
       const formData = new FormData();
       formData.append('file', file);
-      res = await fetch('/api/research/rhi-temp/import-csv', {
+      res = await fetch(withCursor('/api/research/rhi-temp/import-csv'), {
         method: 'POST',
         credentials: 'same-origin',
         body: formData
       });
     } else {
-      res = await fetch('/api/research/rhi-temp/import-csv', {
+      res = await fetch(withCursor('/api/research/rhi-temp/import-csv'), {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         credentials: 'same-origin',
@@ -796,8 +817,7 @@
       setStatus(data.error || 'CSV import failed', true);
       return;
     }
-    state.records = data.records || [];
-    state.summary = data.summary || {};
+    applyRecords(data);
     if (els.csvFile) els.csvFile.value = '';
     if (els.csvText) els.csvText.value = '';
     renderAll();
@@ -814,7 +834,7 @@
     }
     setStatus('Importing Google Sheet...');
     setSheetStatus('Importing Google Sheet...');
-    const res = await fetch('/api/research/rhi-temp/import-sheet', {
+    const res = await fetch(withCursor('/api/research/rhi-temp/import-sheet'), {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       credentials: 'same-origin',
@@ -831,8 +851,7 @@
       console.error('Google Sheet import failed', data);
       return;
     }
-    state.records = data.records || [];
-    state.summary = data.summary || {};
+    applyRecords(data);
     renderAll();
     const tab = data.sheet_title ? ` from "${data.sheet_title}"` : '';
     const excluded = data.excluded ? ` Excluded ${data.excluded} participant(s).` : '';
@@ -860,8 +879,7 @@
       setStatus(data.error || 'Clear data failed', true);
       return;
     }
-    state.records = data.records || [];
-    state.summary = data.summary || {};
+    applyRecords(data);
     renderAll();
     setStatus('Cleared local RHI temperature data. You can reimport from Google Sheets now.');
   }